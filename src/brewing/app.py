@@ -11,6 +11,8 @@ from brewing.context import push_app
 from brewing.serialization import ExcludeCachedProperty
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
     from brewing.db import Database
 
 type CLIUnionType = CLI[Any] | Brewing
@@ -47,8 +49,12 @@ class Brewing(ExcludeCachedProperty):
     current_component: BrewingComponentType | None = None
 
     def __post_init__(self):
-        for name, component in self.all_components.items():
-            component.register(name, self)
+        for name, component in self.components.items():
+            # As in all_components, the database takes precedence over a
+            # component that was also given the name "db".
+            if name != "db":
+                component.register(name, self)
+        self.database.register("db", self)
 
     @cached_property
     def cli(self):
@@ -60,16 +66,19 @@ class Brewing(ExcludeCachedProperty):
 
     @cached_property
     def all_components(self):
-        return self.components | {"db": self.database}
+        return {**self.components, "db": self.database}
 
-    def __getstate__(self) -> dict[str, Any]:
-        state = super().__getstate__()
-        state.pop("_push", None)
-        return state
+    @cached_property
+    def _pushes(self) -> list[AbstractContextManager[None]]:
+        # A cached_property so that ExcludeCachedProperty leaves it out of pickles.
+        return []
 
     def __enter__(self):
-        self._push = push_app(self)
-        self._push.__enter__()
+        push = push_app(self)
+        push.__enter__()
+        # Keep one push per entry so nested use unwinds in order.
+        self._pushes.append(push)
+        return self
 
     def __exit__(self, *args: Any):
-        self._push.__exit__(*args)
+        self._pushes.pop().__exit__(*args)
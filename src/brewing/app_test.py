@@ -10,6 +10,7 @@ from unittest.mock import MagicMock
 import brewing.plugin
 from brewing import CLI, CLIOptions, plugin
 from brewing.app import Brewing
+from brewing.context import _CURRENT_APP, current_app  # pyright: ignore[reportPrivateUsage]
 from brewing.db import Database, new_base
 from brewing.db import testing as db_testing
 from brewing.db.settings import DatabaseType
@@ -38,6 +39,16 @@ def test_brewing(subtests: SubTests):
         db.register.assert_called_once_with("db", app)  # type: ignore
 
 
+def test_brewing_database_replaces_db_component():
+    """A component named "db" is superseded by the database, and not registered."""
+    shadowed = MagicMock()
+    db = MagicMock()
+    app = Brewing(name="test", database=db, components={"db": shadowed})
+    assert app.all_components == {"db": db}
+    shadowed.register.assert_not_called()
+    db.register.assert_called_once_with("db", app)  # type: ignore
+
+
 def sample_entrypoints():
     return [
         EntryPoint(name="foo", value="foo.bar:cheese", group="brewing"),
@@ -76,6 +87,31 @@ def test_main_cli_brewing_entrypoints_of_current_project_added_to_root_cli():
     } == {"hidden", "foo-1"}
 
 
+def test_main_cli_loads_each_entrypoint_once():
+    """Entrypoints are loaded once, even when also merged into the root CLI."""
+    loader = MagicMock(return_value=CLI(CLIOptions(name="foo")))
+    plugin.main_cli(
+        entrypoints=sample_entrypoints(),
+        entrypoint_loader=loader,
+        project_provider=lambda: "foo",
+    )
+    assert loader.call_count == 2
+
+
+def test_main_cli_resolves_current_project_once():
+    """The current project is looked up once, and not at all without entrypoints."""
+    provider = MagicMock(return_value="foo")
+    plugin.main_cli(
+        entrypoints=sample_entrypoints(),
+        entrypoint_loader=lambda _: CLI(CLIOptions(name="foo")),
+        project_provider=provider,
+    )
+    provider.assert_called_once_with()
+    provider.reset_mock()
+    plugin.main_cli(entrypoints=sample_entrypoints()[2:], project_provider=provider)
+    provider.assert_not_called()
+
+
 Base = new_base()
 
 
@@ -117,3 +153,27 @@ def test_brewing_with_pickle_roundtrip(subtests: SubTests):
             after = round_trip(app)
             assert before is not after
             assert before == after
+
+
+def test_brewing_context_can_be_reentered():
+    """Nested use of a brewing instance as a context manager unwinds correctly."""
+    with db_testing.testing(DatabaseType.sqlite):
+        app = Brewing(name="test", database=Database(base=Base), components={})
+        with app as entered:
+            assert entered is app
+            with app:
+                assert current_app() is app
+            assert current_app() is app
+        assert _CURRENT_APP.get() is None
+
+
+def test_viewset_routes_registered_once(subtests: SubTests):
+    """Viewset endpoints are registered once, including after a pickle round trip."""
+    viewset = HealthCheckViewset()
+    expected = ["/livez", "/readyz"]
+    with subtests.test("included-in-app"):
+        _ = BrewingHTTP(viewsets=[viewset]).fastapi
+        assert [r.path for r in viewset.routes] == expected  # type: ignore
+    with subtests.test("after-unpickling"):
+        restored = pickle.loads(pickle.dumps(viewset))
+        assert [r.path for r in restored.routes] == expected
@@ -53,11 +53,8 @@ def _is_callback(func: Any) -> bool:
     return hasattr(func, _CALLBACK_KEY)
 
 
-def _revise_annotation(func: Revisable, param: inspect.Parameter) -> Any:
+def _revise_annotation(param: inspect.Parameter, type_hint: Any) -> Any:
     """Return a revised annotation for parameter of function."""
-    type_hint = get_type_hints(func, include_extras=True).get(
-        param.name
-    )  # Needed for the values of annotations
     if type_hint is None:
         return None
     metadata = getattr(type_hint, "__metadata__", ())
@@ -75,8 +72,10 @@ def _revise_annotation(func: Revisable, param: inspect.Parameter) -> Any:
 
 
 def _revise_annotations(func: Revisable):
+    # Needed for the values of annotations; resolved once for all parameters.
+    type_hints = get_type_hints(func, include_extras=True)
     func.__annotations__ = {
-        name: _revise_annotation(func, param)
+        name: _revise_annotation(param, type_hints.get(name))
         for name, param in inspect.signature(func, eval_str=True).parameters.items()
     }
 
@@ -175,6 +174,12 @@ class CLI[OptionsT: CLIBaseOptions]:
         This allows a CLI instance to be used precisely as a typer instance
         would be.
         """
+        if name.startswith("__"):
+            # Dunder probes (copy, pickle, introspection tools) are never meant
+            # for typer, so fail fast rather than forwarding them.
+            raise AttributeError(
+                f"{self.__class__.__name__!r} object has no attribute {name!r}"
+            )
         return getattr(self._typer, name)
 
     @staticmethod
@@ -344,3 +344,11 @@ def test_callback(subtests: SubTests):
         result = runner.invoke(["quiet"])
         assert result.stdout.strip() == "calling back!\nsomething"
         assert result.exit_code == 0
+
+
+def test_getattr_proxies_to_typer(subtests: SubTests):
+    cli = CLI(CLIOptions("root"))
+    with subtests.test("typer-attribute"):
+        assert cli.registered_commands is cli.typer.registered_commands
+    with subtests.test("dunder-not-proxied"), pytest.raises(AttributeError):
+        cli.__wrapped__  # noqa: B018
@@ -27,7 +27,7 @@ class ContextNotAvailable(LookupError):
 
 def current_app() -> Brewing:
     """Get the current active brewing instance."""
-    if app := _CURRENT_APP.get():
+    if (app := _CURRENT_APP.get()) is not None:
         return app
     if app_bytes := os.environ.get(CURRENT_APP_BYTES_ENV):
         app = pickle.loads(base64.b64decode(app_bytes.encode()))
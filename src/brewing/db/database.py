@@ -169,11 +169,13 @@ class Database:
 
 @asynccontextmanager
 async def db_session() -> AsyncGenerator[AsyncSession]:
-    db = current_database()
-    if session := _CURRENT_DB_SESSION.get():
+    if (session := _CURRENT_DB_SESSION.get()) is not None:
         yield session
         return
-    async with AsyncSession(bind=db.engine, expire_on_commit=False) as session:
+    # Only resolve the database when a new session is actually needed.
+    async with AsyncSession(
+        bind=current_database().engine, expire_on_commit=False
+    ) as session:
         token = _CURRENT_DB_SESSION.set(session)
         yield session
         _CURRENT_DB_SESSION.reset(token)
@@ -35,7 +35,9 @@ class MigrationsConfigError(RuntimeError):
 class Migrations:
     """Controls migrations."""
 
-    active_instance: ClassVar[ContextVar[Migrations]] = ContextVar("current_config")
+    active_instance: ClassVar[ContextVar[Migrations | None]] = ContextVar(
+        "current_config", default=None
+    )
 
     def __init__(
         self,
@@ -45,7 +47,7 @@ class Migrations:
         self._database = database
         self._revisions_dir = revisions_dir
         self._runner = MigrationRunner(self)
-        self._token: Token[Migrations] | None = None
+        self._tokens: list[Token[Migrations | None]] = []
         self._alembic = AlembicConfig()
         self._alembic.set_main_option(
             "script_location", str(MIGRATIONS_CONTEXT_DIRECTORY)
@@ -86,13 +88,14 @@ class Migrations:
 
     def __enter__(self):
         """Set the migrations context to allow alembic to be invoked."""
-        self._token = self.active_instance.set(self)
+        # Tokens are stacked so that re-entering the same instance
+        # (e.g. generate_revision inside an active context) unwinds correctly.
+        self._tokens.append(self.active_instance.set(self))
 
     def __exit__(self, *_: Any, **__: Any):
         """Cleanup context."""
-        if self._token:
-            self.active_instance.reset(self._token)
-            self._token = None
+        if self._tokens:
+            self.active_instance.reset(self._tokens.pop())
 
     def generate_revision(self, message: str, autogenerate: bool = True):
         """Generate a new migration."""
@@ -104,9 +107,10 @@ class Migrations:
             self,
         ):
             command.upgrade(self.alembic, "head")
+            revision_count = sum(1 for _ in self._revisions_dir.glob("*.py"))
             command.revision(
                 self._alembic,
-                rev_id=f"{len(list(self._revisions_dir.glob('*.py'))):05d}",
+                rev_id=f"{revision_count:05d}",
                 message=message,
                 autogenerate=autogenerate,
             )
@@ -194,13 +198,13 @@ class NoActiveMigrationContext(RuntimeError):
 
 def run():
     """Run migrations in the current context."""
+    migrations = Migrations.active_instance.get()
+    if migrations is None:
+        raise NoActiveMigrationContext("no current runner configured.")
     try:
-        if migrations := Migrations.active_instance.get():
-            if context.is_offline_mode():
-                migrations.runner.offline()
-            else:
-                migrations.runner.online()
+        if context.is_offline_mode():
+            migrations.runner.offline()
         else:
-            raise RuntimeError("no current runner configured.")
+            migrations.runner.online()
     except AttributeError as err:
         raise NoActiveMigrationContext() from err
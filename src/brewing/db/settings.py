@@ -31,7 +31,7 @@ class DatabaseType(StrEnum):
         return _DATABASE_TYPE_TO_DIALECT[self]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Dialect:
     """Collection of data associated with a given database type."""
 
@@ -211,7 +211,7 @@ mariadb = partial(_mysql, image="mariadb:latest", contextvar=_current_mariadb)
 mariadb_compose = partial(_mysql_compose, image="mariadb:latest")
 
 
-@dataclass
+@dataclass(slots=True)
 class _DatabaseTestImp:
     test: TestingDatabase
     dev: TestingDatabase
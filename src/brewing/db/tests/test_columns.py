@@ -143,3 +143,10 @@ async def test_created_updated_field_changed_after_record_updated(
         new_updated = read_instance.updated_at
         assert orig_created == new_created
         assert orig_updated < new_updated
+
+
+@pytest.mark.asyncio
+async def test_nested_db_session_reuses_session(db: Database):
+    """A db_session opened inside another yields the already-active session."""
+    async with db_session() as outer, db_session() as inner:
+        assert inner is outer
@@ -4,6 +4,7 @@ import importlib.util
 import inspect
 from textwrap import dedent
 from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 
 import pytest
 import pytest_alembic.tests.default
@@ -14,6 +15,8 @@ from testing_samples import db_sample1
 from brewing.db import Database
 from brewing.db.migrate import (
     Migrations,
+    NoActiveMigrationContext,
+    run,
 )
 
 if TYPE_CHECKING:
@@ -59,6 +62,20 @@ def load_module_from_file(path: Path) -> ModuleType:
     return module
 
 
+def test_migrations_context_can_be_reentered(tmp_path: Path):
+    migrations = Migrations(database=MagicMock(), revisions_dir=tmp_path)
+    with migrations:
+        with migrations:
+            assert Migrations.active_instance.get() is migrations
+        assert Migrations.active_instance.get() is migrations
+    assert Migrations.active_instance.get() is None
+
+
+def test_run_without_active_context():
+    with pytest.raises(NoActiveMigrationContext):
+        run()
+
+
 class TestMigrations:
     @staticmethod
     def test_generate_migration_without_autogenerate(migrations: Migrations):
@@ -61,33 +61,35 @@ def runtime_generic[T](cls: type[T]) -> type[T]:
 
     """
 
+    @cache
+    def _unbound_annotations() -> dict[str, Any]:
+        """Return the annotations of cls's unbound class attributes.
+
+        Resolving type hints walks the whole MRO, so this is done once per
+        decorated class rather than once per parametrization.
+        """
+        class_attributes = _get_class_attributes(cls)
+        return {
+            k: v for k, v in _get_type_hints(cls).items() if k not in class_attributes
+        }
+
     def _subclass(types: type | tuple[type | TypeVar, ...]):
         """Create a subclass of cls with generic parameters applied."""
         nonlocal cls
-        all_annotations = _get_type_hints(cls)
-        unbound_class_attributes = set(all_annotations.keys()).difference(
-            _get_class_attributes(cls)
-        )
-        annotations = {
-            k: v for k, v in all_annotations.items() if k in unbound_class_attributes
-        }
+        annotations = _unbound_annotations()
         if not isinstance(types, tuple):
             types = (types,)
         if TypeVar in (type(t) for t in types):
             return cls
-        if len(unbound_class_attributes) != len(types):
+        if len(annotations) != len(types):
             raise TypeError(
-                f"for {cls}, expected {len(unbound_class_attributes)} parameter(s), got {len(types)} parameter(s)."
+                f"for {cls}, expected {len(annotations)} parameter(s), got {len(types)} parameter(s)."
             )
+        bindings = dict(zip(cls.__parameters__, types, strict=True))  # type: ignore
         return type(
             f"{cls.__name__}[{','.join(t.__name__ for t in types)}]",
             (cls,),
-            {
-                k: dict(zip(cls.__parameters__, types, strict=True))[  # type: ignore
-                    v.__parameters__[0]
-                ]
-                for k, v in annotations.items()
-            },
+            {k: bindings[v.__parameters__[0]] for k, v in annotations.items()},
         )
 
     if not hasattr(cls, "__parameters__"):
@@ -6,6 +6,7 @@ from typing import ClassVar, Literal
 
 import pytest
 
+from brewing import generic
 from brewing.generic import runtime_generic
 
 
@@ -202,3 +203,23 @@ def test_with_other_class_attributes():
     # It is also shared by subclasses if they don't do anything
     # To change the situation.
     assert HasOtherClassAttributes[B, A]().c == {"foo": "bar"}
+
+
+def test_type_hints_resolved_once_per_class(monkeypatch: pytest.MonkeyPatch):
+    """Type hints are resolved once per decorated class, not per parametrization."""
+    calls: list[type] = []
+    original = generic._get_type_hints  # noqa: SLF001
+
+    def counting_get_type_hints(cls: type):
+        calls.append(cls)
+        return original(cls)
+
+    monkeypatch.setattr(generic, "_get_type_hints", counting_get_type_hints)
+
+    @runtime_generic
+    class CountsHints[T1]:
+        a: type[T1]
+
+    assert CountsHints[A]().a is A
+    assert CountsHints[B]().a is B
+    assert calls == [CountsHints]
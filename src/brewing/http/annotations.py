@@ -42,7 +42,7 @@ type AnnotatedFunctionAdaptorPipeline = Sequence[AnnotatedFunctionAdaptor]
 _ADAPTOR_KEY = "_brewing_adaptor"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Annotation:
     """Struct representing a single annotation."""
 
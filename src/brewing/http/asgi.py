@@ -11,7 +11,6 @@ from dataclasses import asdict, dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING, Annotated
 
-import uvicorn
 from fastapi import FastAPI
 from typer import Option
 
@@ -76,7 +75,6 @@ class BrewingHTTP(ExcludeCachedProperty):
         """Return fastapi instance associated with the HTTP class."""
         app = FastAPI(**asdict(self))
         for v in self.viewsets:
-            v.__post_init__()
             app.include_router(v.router)
         return app
 
@@ -110,6 +108,8 @@ class BrewingHTTP(ExcludeCachedProperty):
             port: int = 8000,
         ):
             """Run the HTTP server."""
+            import uvicorn  # noqa: PLC0415
+
             with brewing:
                 if dev:
                     context = (
@@ -36,7 +36,7 @@ class PathValidationError(Exception):
     """A problem relating to an HTTP path configuration."""
 
 
-@dataclass(init=False)
+@dataclass(init=False, slots=True)
 class HTTPPathComponent:
     """
     Represents a component of an HTTP path..
@@ -82,7 +82,7 @@ class HTTPPathComponent:
         return self.value
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class TrailingSlashPolicy:
     """
     Defines how to decide on whether to use a trailing slash.
@@ -185,7 +185,7 @@ class HTTPPath:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeferredDecoratorCall:
     """Represents a call made whose outcome is deferred from class definition to class instantiation."""
 
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field, replace
 from functools import cached_property
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter
 from fastapi.params import Depends
@@ -29,6 +29,7 @@ from brewing.http.path import (
 from brewing.serialization import ExcludeCachedProperty
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from enum import Enum
     from types import EllipsisType, FunctionType
 
@@ -48,8 +49,19 @@ class ViewSet(ExcludeCachedProperty):
     tags: list[str | Enum] | None = None
 
     def __post_init__(self):
-        self._rewrite_fastapi_style_depends()
-        self._setup_classbased_endpoints()
+        # Scanning the instance is costly, so both setup steps share one scan.
+        methods = self._all_methods()
+        self._rewrite_fastapi_style_depends(methods)
+        self._setup_classbased_endpoints(methods)
+
+    def __setstate__(self, state: dict[str, Any]):
+        """Restore a viewset from its pickled state.
+
+        The router is a cached property, so it is not pickled; the class-based
+        endpoints are registered again onto a fresh router here.
+        """
+        self.__dict__.update(state)
+        self.__post_init__()
 
     @cached_property
     def GET(self):
@@ -109,15 +121,14 @@ class ViewSet(ExcludeCachedProperty):
         """Expose, immutably, the starlette routes associated with the viewset."""
         return tuple(self.router.routes)
 
-    def _all_methods(self):
-        return [
-            getattr(self, m)
-            for m in dir(self)
-            if callable(getattr(self, m)) and m[0] != "_"
-        ]
+    def _all_methods(self) -> list[Callable[..., Any]]:
+        attributes = (getattr(self, name) for name in dir(self) if name[0] != "_")
+        return [attribute for attribute in attributes if callable(attribute)]
 
-    def _rewrite_fastapi_style_depends(self):
-        for method in self._all_methods():
+    def _rewrite_fastapi_style_depends(self, methods: list[Callable[..., Any]]):
+        # The viewset's own functions, to recognise Depends() on sibling methods.
+        method_functions = [getattr(f, "__func__", ...) for f in methods]
+        for method in methods:
             try:
                 annotation_state = AnnotationState(method)
             except TypeError:
@@ -127,11 +138,10 @@ class ViewSet(ExcludeCachedProperty):
                 if value.annotated:
                     annotations_as_list = list(value.annotated)
                     for annotation in value.annotated:
-                        if isinstance(
-                            annotation, Depends
-                        ) and annotation.dependency in [
-                            getattr(f, "__func__", ...) for f in self._all_methods()
-                        ]:
+                        if (
+                            isinstance(annotation, Depends)
+                            and annotation.dependency in method_functions
+                        ):
                             annotations_as_list.remove(annotation)
                             annotations_as_list.append(
                                 Depends(getattr(self, annotation.dependency.__name__))  # type: ignore
@@ -140,10 +150,10 @@ class ViewSet(ExcludeCachedProperty):
                 annotation_state.hints[key] = value
             annotation_state.apply_pending()
 
-    def _setup_classbased_endpoints(self):
+    def _setup_classbased_endpoints(self, methods: list[Callable[..., Any]]):
         decorated_methods: list[tuple[FunctionType, list[DeferredDecoratorCall]]] = [  # type: ignore
             (m, getattr(m, DeferredHTTPPath.METADATA_KEY, None))
-            for m in self._all_methods()
+            for m in methods
             if getattr(m, DeferredHTTPPath.METADATA_KEY, None)
         ]
         for decorated_method in decorated_methods:
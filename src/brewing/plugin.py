@@ -7,17 +7,24 @@ provide a CLI that can be attached to the brewing CLI.
 This module has functionality to load these plugins.
 """
 
-import importlib.metadata
-import tomllib
-from collections.abc import Callable, Iterable
+from __future__ import annotations
+
+from collections.abc import Callable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from brewing.app import Brewing, CLIUnionType
 from brewing.cli import CLI, CLIOptions
 
+if TYPE_CHECKING:
+    import importlib.metadata
+    from collections.abc import Iterable
+
 type EntrypointLoader = Callable[[importlib.metadata.EntryPoint], CLIUnionType]
 type CurrentProjectProvider = Callable[[], str | None]
 
+_UNDERSCORE_TO_DASH = str.maketrans("_", "-")
+
 
 def load_entrypoint(
     entrypoint: importlib.metadata.EntryPoint,
@@ -39,6 +46,8 @@ def load_entrypoint(
 
 def current_project(search_dir: Path | None = None) -> str | None:
     """Scan from the current working directory to find the name of the current project."""
+    import tomllib  # noqa: PLC0415
+
     search_dir = search_dir or Path.cwd()
     for file in (
         path / "pyproject.toml" for path in [search_dir, *list(search_dir.parents)]
@@ -65,17 +74,25 @@ def main_cli(
     via [project.entry-points.brewing], includimg brewing's own toolset
     and any other that can be detected in the current context.
     """
+    import importlib.metadata  # noqa: PLC0415
+
     cli = CLI(options or CLIOptions(name="brewing"))
     entrypoints = [
         e
         for e in (entrypoints or importlib.metadata.entry_points())
         if e.group == "brewing"
     ]
+    if not entrypoints:
+        return cli
+    # Resolving the current project scans the filesystem, so do it once.
+    project = project_provider()
     for entrypoint in entrypoints:
-        if entrypoint.module.split(".")[0].replace("_", "-") == project_provider():
+        typer = entrypoint_loader(entrypoint).typer
+        top_module = entrypoint.module.partition(".")[0]
+        if top_module.translate(_UNDERSCORE_TO_DASH) == project:
             # The current project, if identifiable, is merged into the
             # top-level typer by providing the name as None
             # Otherwise we will use the entrypoint name to
-            cli.typer.add_typer(entrypoint_loader(entrypoint).typer, name=None)
-        cli.typer.add_typer(entrypoint_loader(entrypoint).typer, name=entrypoint.name)
+            cli.typer.add_typer(typer, name=None)
+        cli.typer.add_typer(typer, name=entrypoint.name)
     return cli
@@ -14,7 +14,6 @@ from typer import Option
 from brewing.cli import CLI, CLIOptions
 from brewing.db import DatabaseType  # noqa: TC001
 from brewing.project.generation import ProjectConfiguration
-from brewing.project.state import init
 
 logger = structlog.get_logger()
 
@@ -42,6 +41,10 @@ class ProjectCLI(CLI[CLIOptions]):
         ] = None,
     ):
         """Initialize a new brewing project."""
+        # The pyproject models and TOML writer are only needed here, so they
+        # are not imported every time the brewing CLI is built.
+        from brewing.project.state import init  # noqa: PLC0415
+
         path = path or Path.cwd()
         config = ProjectConfiguration(
             name=name or path.name, path=path.resolve(), db_type=db_type
@@ -15,7 +15,7 @@ type Directory = MutableMapping[FileNameGenerator, File]
 type File = FileContentGenerator | str | Directory
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfiguration:
     """Shared context for the project initialization."""
 
@@ -24,7 +24,7 @@ class ProjectConfiguration:
     path: Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ManagedDirectory:
     """A directory whose contents are managed by brewing."""
 
@@ -38,31 +38,50 @@ class MaterializationError(RuntimeError):
 
 def materialize_directory(directory: ManagedDirectory) -> None:
     """Ensure that the directory matches the configuration."""
-    for name_generator, file_generator in list(directory.files.items()):
-        filename = (
-            name_generator(directory.config)
-            if callable(name_generator)
-            else name_generator
-        )
-        file = (
-            file_generator(directory.config)
-            if callable(file_generator)
-            else file_generator
-        )
-        path = directory.config.path / filename
-        if isinstance(file, str):
-            materialize_file(file, filename, directory.config)
-            continue
-        path.mkdir(exist_ok=True, parents=True)
-        subdir = directory.__class__(
-            files=cast("Directory", directory.files[name_generator]),
-            config=replace(directory.config, path=path),
-        )
-        materialize_directory(subdir)
+    # Subdirectories are joined onto the validated root path, so they are
+    # valid too; only the root needs checking.
+    _validate_directory(directory.config)
+    # Walk the tree with an explicit stack rather than recursing, pairing
+    # each directory's files with the configuration its generators receive.
+    pending: list[tuple[Directory, ProjectConfiguration]] = [
+        (directory.files, directory.config)
+    ]
+    while pending:
+        files, config = pending.pop()
+        config.path.mkdir(exist_ok=True, parents=True)
+        for name_generator, file_generator in files.items():
+            filename = (
+                name_generator(config) if callable(name_generator) else name_generator
+            )
+            file = (
+                file_generator(config) if callable(file_generator) else file_generator
+            )
+            path = config.path / filename
+            if isinstance(file, str):
+                _write_if_changed(path, file.encode())
+            else:
+                pending.append((cast("Directory", file), replace(config, path=path)))
 
 
 def materialize_file(content: str, filename: str, config: ProjectConfiguration) -> None:
     """Materializes the file within the given directory."""
+    _validate_directory(config)
+    config.path.mkdir(exist_ok=True, parents=True)
+    _write_if_changed(config.path / filename, content.encode())
+
+
+def _write_if_changed(path: Path, content: bytes) -> None:
+    """Write content to path, leaving the file untouched if it already matches."""
+    try:
+        unchanged = path.stat().st_size == len(content) and path.read_bytes() == content
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        path.write_bytes(content)
+
+
+def _validate_directory(config: ProjectConfiguration) -> None:
+    """Validate that the configured directory can be materialized."""
     if not config.path.is_absolute():
         raise MaterializationError(
             "Cannot materialize a file with a relative directory"
@@ -71,5 +90,3 @@ def materialize_file(content: str, filename: str, config: ProjectConfiguration)
     # by walking the tree up and checking everything is either a directory or doesn't exist.
     if not config.path.parents:
         raise ValueError("Cannot operate on the root file.")
-    config.path.mkdir(exist_ok=True, parents=True)
-    (config.path / filename).write_text(content)
@@ -2,19 +2,19 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from pathlib import Path
+
+import pytest
 
 from brewing.db import DatabaseType
 from brewing.project.generation import (
     Directory,
     ManagedDirectory,
+    MaterializationError,
     materialize_directory,
 )
 from brewing.project.state import ProjectConfiguration
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 
 def test_project_materializes_files_in_immediate_directory(tmp_path: Path):
     """Simplest test: 2 files in immediate directory."""
@@ -33,9 +33,7 @@ def test_project_materializes_files_in_immediate_directory(tmp_path: Path):
     # If we materialize the project.
     materialize_directory(directory)
     # Then the expected files are  in place
-    assert sorted(tmp_path.iterdir()) == sorted(
-        [tmp_path / "file1", tmp_path / "file2"]
-    )
+    assert set(tmp_path.iterdir()) == {tmp_path / "file1", tmp_path / "file2"}
     # And have the expected content
     assert (tmp_path / "file1").read_text() == "foo"
     assert (tmp_path / "file2").read_text() == "bar"
@@ -127,3 +125,44 @@ def test_computing(tmp_path: Path):
     assert (
         tmp_path / "test-computed" / "test-computed-file"
     ).read_text() == "test-computed-file-content"
+
+
+def test_relative_root_is_rejected():
+    """A directory tree cannot be materialized onto a relative path."""
+    directory = ManagedDirectory(
+        files={"dir1": {"some-file1": "content"}},
+        config=ProjectConfiguration(
+            name="test", path=Path("relative"), db_type=DatabaseType.sqlite
+        ),
+    )
+    with pytest.raises(MaterializationError):
+        materialize_directory(directory)
+
+
+def test_unchanged_files_are_not_rewritten(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Materializing again only rewrites files whose content differs."""
+    # Given a materialized directory
+    files: Directory = {"same": "foo", "changed": "bar"}
+    directory = ManagedDirectory(
+        files=files,
+        config=ProjectConfiguration(
+            name="test", path=tmp_path, db_type=DatabaseType.sqlite
+        ),
+    )
+    materialize_directory(directory)
+    (tmp_path / "changed").write_text("baz")
+    written: list[Path] = []
+    write_bytes = Path.write_bytes
+
+    def spy(self: Path, data: bytes) -> int:
+        written.append(self)
+        return write_bytes(self, data)
+
+    monkeypatch.setattr(Path, "write_bytes", spy)
+    # If we materialize it again
+    materialize_directory(directory)
+    # Then only the differing file is written, and it is restored.
+    assert written == [tmp_path / "changed"]
+    assert (tmp_path / "changed").read_text() == "bar"
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field, RootModel, field_validator, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class ProjectAuthor(BaseModel):
@@ -34,11 +34,11 @@ class Project(BaseModel):
     license: str | None = None
     keywords: list[str] | None = None
     classifiers: list[str] | None = None
-    urls: RootModel[dict[str, str]] | None = None
-    entry_points: RootModel[dict[str, dict[str, str]]] | None = Field(
+    urls: dict[str, str] | None = None
+    entry_points: dict[str, dict[str, str]] | None = Field(
         default=None, serialization_alias="entry-points"
     )
-    scripts: RootModel[dict[str, str]] | None = None
+    scripts: dict[str, str] | None = None
 
     @field_validator("name", mode="after")
     @classmethod
@@ -59,7 +59,7 @@ class PyprojectTomlData(BaseModel):
 
     project: Project
     build_system: BuildSystem = Field(default=..., serialization_alias="build-system")
-    dependency_groups: RootModel[dict[str, list[str]]] | None = Field(
+    dependency_groups: dict[str, list[str]] | None = Field(
         default=None, serialization_alias="dependency-groups"
     )
-    tool: RootModel[dict[str, Any]] | None = None
+    tool: dict[str, Any] | None = None
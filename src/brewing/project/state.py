@@ -4,8 +4,7 @@ import sys
 from textwrap import dedent
 
 import structlog
-import tomlkit
-from pydantic import RootModel, alias_generators
+import tomli_w
 
 from brewing.project import pyproject
 from brewing.project.generation import (
@@ -23,10 +22,8 @@ def empty_file_content(context: ProjectConfiguration):  # noqa: ARG001
     return ""
 
 
-def initial_app_file(context: ProjectConfiguration):
-    """Return the content of the initial app.py file."""
-    return dedent(
-        f'''
+_APP_FILE_TEMPLATE = dedent(
+    '''
 
     # ruff: noqa: PLC0415
     from pathlib import Path
@@ -53,48 +50,55 @@ def initial_app_file(context: ProjectConfiguration):
             database=Database(
                 base=Base,
                 revisions_directory=Path(__file__).parent / "db_revisions",
-                db_type=DatabaseType.{context.db_type.value},
+                db_type=DatabaseType.{db_type},
             ),
             components={{"http": BrewingHTTP(viewsets=[HealthCheckViewset(tags=["health"])])}},
         )
 
 
     '''
-    )
+)
 
 
-_PLACEHOLDER_PROJECT_NAME = "{PROJECT_NAME}"
+def initial_app_file(context: ProjectConfiguration):
+    """Return the content of the initial app.py file."""
+    return _APP_FILE_TEMPLATE.format(db_type=context.db_type.value)
+
+
+# Only the project table depends on the configuration; the rest of the
+# generated pyproject.toml is fixed, so it is built once at import time.
+_REQUIRES_PYTHON = f">={sys.version_info.major}.{sys.version_info.minor}"
+_BUILD_SYSTEM = pyproject.BuildSystem(
+    requires=["hatchling"], build_backend="hatchling.build"
+)
+_DEPENDENCY_GROUPS = {"dev": ["brewing[testing]", "pytest"]}
 
 
 def load_pyproject_content(context: ProjectConfiguration):
     """Load the pyproject.toml file."""
-    return tomlkit.dumps(
+    return tomli_w.dumps(
         pyproject.PyprojectTomlData(
             project=pyproject.Project(
                 name=context.name,
                 version="0.0.1",
-                requires_python=f">={sys.version_info.major}.{sys.version_info.minor}",
+                requires_python=_REQUIRES_PYTHON,
                 dependencies=[f"brewing[{context.db_type.value}]"],
                 readme="README.md",
-                entry_points=RootModel(
-                    root={
-                        "brewing": {
-                            context.name: f"{context.name.replace('-', '_')}.app:app"
-                        }
+                entry_points={
+                    "brewing": {
+                        context.name: f"{project_name_with_underscores(context)}.app:app"
                     }
-                ),
-            ),
-            build_system=pyproject.BuildSystem(
-                requires=["hatchling"], build_backend="hatchling.build"
+                },
             ),
-            dependency_groups=RootModel(root={"dev": ["brewing[testing]", "pytest"]}),
+            build_system=_BUILD_SYSTEM,
+            dependency_groups=_DEPENDENCY_GROUPS,
         ).model_dump(mode="json", exclude_none=True, by_alias=True)
     )
 
 
 def project_name_with_underscores(context: ProjectConfiguration):
     """Return project name in form suitable for python attributes."""
-    return alias_generators.to_snake(context.name)
+    return context.name.replace("-", "_")
 
 
 def init_layout() -> Directory:
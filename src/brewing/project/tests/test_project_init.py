@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import os
-import signal
 import socket
 import subprocess
 import sys
+import tempfile
 from contextlib import closing, contextmanager
 from functools import partial
 from pathlib import Path
@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING, Any
 import httpx
 import pytest
 import uv
-from tenacity import retry, stop_after_delay, wait_exponential_jitter
+from tenacity import retry, retry_if_exception_type, stop_after_delay, wait_fixed
 
 import brewing
 from brewing.cli.testing import BrewingCLIRunner
@@ -45,13 +45,24 @@ def cd(path: Path | str):
 
 @contextmanager
 def run(*cmd: str, readiness_callback: Callable[..., Any], cwd: Path | None = None):
-    """Run given command in a background thread."""
-    proc = subprocess.Popen(cmd, stdout=sys.stdout, stderr=sys.stderr, cwd=cwd)
-    readiness_callback()
-    yield
-    proc.send_signal(signal.SIGTERM)
-    proc.wait(5)
-    proc.kill()
+    """Run given command in a background process."""
+    # The server's output goes to a file rather than the test runner's
+    # stdout, so it never blocks on the terminal; it is replayed on failure.
+    with tempfile.TemporaryFile() as log:
+        proc = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT, cwd=cwd)
+        try:
+            readiness_callback()
+            yield
+        except BaseException:
+            log.seek(0)
+            sys.stdout.write(log.read().decode(errors="replace"))
+            raise
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
 
 
 def cli_runner():
@@ -130,25 +141,33 @@ def test_project_init(tmp_path: Path, db_type: DatabaseType):
         project_dir / ".gitignore",
     }
 
-    @retry(wait=wait_exponential_jitter(initial=0.1, max=2), stop=stop_after_delay(15))
-    def readiness_callback(port: int):
-        live_status = httpx.get(f"http://127.0.0.1:{port}/livez")
+    @retry(
+        wait=wait_fixed(0.05),
+        stop=stop_after_delay(15),
+        retry=retry_if_exception_type(httpx.HTTPError),
+    )
+    def readiness_callback(client: httpx.Client):
+        live_status = client.get("/livez")
         live_status.raise_for_status()
-        ready_status = httpx.get(f"http://127.0.0.1:{port}/readyz")
+        ready_status = client.get("/readyz")
         ready_status.raise_for_status()
 
     # start the dev server (in another thread)
     with db_testing.dev(db_type):
         port = find_free_port()
-        with run(
-            "uv",
-            "run",
-            "brewing",
-            "http",
-            "--dev",
-            "--port",
-            str(port),
-            readiness_callback=partial(readiness_callback, port),
-            cwd=project_dir,
+        # One client for all probes, so retries reuse a kept-alive connection.
+        with (
+            httpx.Client(base_url=f"http://127.0.0.1:{port}") as client,
+            run(
+                "uv",
+                "run",
+                "brewing",
+                "http",
+                "--dev",
+                "--port",
+                str(port),
+                readiness_callback=partial(readiness_callback, client),
+                cwd=project_dir,
+            ),
         ):
             pass  # The test is all in the contextmanager
@@ -0,0 +1,31 @@
+"""Project init - generated layout is self-consistent."""
+
+from __future__ import annotations
+
+import tomllib
+from typing import TYPE_CHECKING
+
+import pytest
+
+from brewing.db.settings import DatabaseType
+from brewing.project.generation import ProjectConfiguration
+from brewing.project.state import init
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("name", ["proj2", "my-proj", "MyProj"])
+def test_entrypoint_targets_generated_app(tmp_path: Path, name: str):
+    """The brewing entrypoint of a new project points at its generated app module."""
+    # Given a project initialized with the given name
+    init(ProjectConfiguration(name=name, db_type=DatabaseType.sqlite, path=tmp_path))
+    # If we read the entrypoint from pyproject.toml
+    pyproject = tomllib.loads((tmp_path / "pyproject.toml").read_text())
+    target = pyproject["project"]["entry-points"]["brewing"][name]
+    module, _, attribute = target.partition(":")
+    # Then it names the app attribute of the generated app.py
+    assert attribute == "app"
+    package, _, submodule = module.partition(".")
+    assert submodule == "app"
+    assert (tmp_path / "src" / package / "app.py").is_file()